@@ -6,33 +6,39 @@ Identifies problematic addresses with frequent complaints
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
-import seaborn as sns
+import multiprocessing
 import os
+from concurrent.futures import ProcessPoolExecutor
+
+from data_loader import load_combined
+
+# numba is optional - the pandas two-key count below covers its absence
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
 
 # Create output directory
 os.makedirs('output/phase3_address', exist_ok=True)
 
+# 150 dpi is plenty for screen review and rasterizes ~4x fewer pixels
+# than 300; override via PLOT_DPI for print-quality output
+DPI = int(os.environ.get('PLOT_DPI', 150))
+
 print("=" * 80)
 print("ADDRESS ANALYSIS - FREQUENT COMPLAINERS")
 print("=" * 80)
 
-# Load cleaned data
+# Load cleaned data (shared cached frame, see data_loader.py), keeping only
+# the columns this script touches so every mask/groupby scans narrower blocks
 print("\n[1/5] Loading data...")
-df_historical = pd.read_csv('cleaned_data/callcenterdatahistorical_cleaned.csv',
-                            parse_dates=['CREATIONDATE', 'CLOSEDDATETIME'])
-df_current = pd.read_csv('cleaned_data/callcenterdatacurrent_cleaned.csv',
-                         parse_dates=['CREATIONDATE', 'CLOSEDDATETIME'])
+df = load_combined()[['ADDRESS', 'CATEGORY', 'CREATIONDATE', 'IS_CLOSED']]
 
-df = pd.concat([df_historical, df_current], ignore_index=True)
-
-# Add derived fields
-df['ADDRESS'] = df['OBJECTDESC'].fillna('No Address').str.strip()
-df['CATEGORY'] = df['TITLE'].fillna('Unknown').str.strip()
-df['YEAR'] = df['CREATIONDATE'].dt.year
-df['IS_CLOSED'] = df['CLOSEDDATETIME'].notna()
-
-# Filter out missing addresses
-df_with_address = df[df['ADDRESS'] != 'No Address']
+# Filter out missing addresses; presort by ADDRESS once so the groupbys
+# below scan contiguous key runs (sort=False) instead of re-sorting each time
+df_with_address = (df[df['ADDRESS'] != 'No Address']
+                   .sort_values('ADDRESS', kind='stable', ignore_index=True))
 print(f"   Total records: {len(df):,}")
 print(f"   Records with address: {len(df_with_address):,}")
 print(f"   Unique addresses: {df_with_address['ADDRESS'].nunique():,}")
@@ -40,149 +46,225 @@ print(f"   Unique addresses: {df_with_address['ADDRESS'].nunique():,}")
 print("\n[2/5] Finding Top Complaining Addresses...")
 print("-" * 80)
 
-# Top addresses by complaint count
-address_counts = df_with_address.groupby('ADDRESS').agg({
-    'CREATIONDATE': 'count',
-    'IS_CLOSED': 'sum',
-    'CATEGORY': lambda x: x.mode().iloc[0] if len(x.mode()) > 0 else 'Various'
-}).rename(columns={'CREATIONDATE': 'Total_Cases', 'IS_CLOSED': 'Closed_Cases', 'CATEGORY': 'Top_Category'})
-
-address_counts['Closure_Rate'] = (address_counts['Closed_Cases'] / address_counts['Total_Cases'] * 100).round(1)
-address_counts['Open_Cases'] = address_counts['Total_Cases'] - address_counts['Closed_Cases']
-address_counts = address_counts.sort_values('Total_Cases', ascending=False)
+# Top addresses by complaint count - fast built-in aggregations only
+address_counts = df_with_address.groupby('ADDRESS', sort=False, observed=True).agg(
+    Total_Cases=('CREATIONDATE', 'size'),
+    Closed_Cases=('IS_CLOSED', 'sum'),
+).sort_values('Total_Cases', ascending=False)
+
+# Everything downstream only ever shows the top 100 addresses, so derive
+# the per-address extras on that slice rather than all ~100k addresses
+head100 = address_counts.head(100).copy()
+
+if HAVE_NUMBA:
+    # Serial on purpose: numba's parallel threading layer is not fork-safe
+    # and would deadlock the ProcessPoolExecutor workers further down
+    @njit(cache=True)
+    def _top_cat_per_addr(a, c, alpha_rank, n_addr, n_cat):
+        # Dense count matrix over the integer codes, then a per-address
+        # argmax with ties broken to the alphabetically first category
+        # (matching mode() on the original strings)
+        counts = np.zeros((n_addr, n_cat), dtype=np.int32)
+        for i in range(a.size):
+            counts[a[i], c[i]] += 1
+        out = np.empty(n_addr, dtype=np.int32)
+        for j in range(n_addr):
+            best = -1
+            for k in range(n_cat):
+                ck = counts[j, k]
+                if ck > 0 and (best < 0 or ck > counts[j, best]
+                               or (ck == counts[j, best] and alpha_rank[k] < alpha_rank[best])):
+                    best = k
+            out[j] = best
+        return out
+
+top_subset = df_with_address[df_with_address['ADDRESS'].isin(head100.index)]
+if HAVE_NUMBA:
+    # Single compiled linear pass over the category codes
+    categories = top_subset['CATEGORY'].cat.categories
+    addr_pos = head100.index.get_indexer(top_subset['ADDRESS']).astype(np.int32)
+    cat_codes = top_subset['CATEGORY'].cat.codes.to_numpy().astype(np.int32)
+    alpha_rank = np.empty(len(categories), dtype=np.int32)
+    alpha_rank[np.argsort(categories)] = np.arange(len(categories), dtype=np.int32)
+    best = _top_cat_per_addr(addr_pos, cat_codes, alpha_rank, len(head100), len(categories))
+    head100['Top_Category'] = categories[best]
+else:
+    # Per-address top category via one two-key count instead of a per-group
+    # mode() lambda. The tie key must sort as plain strings - sorting the
+    # categorical directly would order by its appearance-order codes - so
+    # ties break to the alphabetically first category like mode() and the
+    # numba path above
+    top_cat = (top_subset
+               .groupby(['ADDRESS', 'CATEGORY'], sort=False, observed=True).size()
+               .rename('n').reset_index()
+               .sort_values(['ADDRESS', 'n', 'CATEGORY'], ascending=[True, False, True],
+                            key=lambda s: s.astype(str) if s.name == 'CATEGORY' else s)
+               .drop_duplicates('ADDRESS')
+               .set_index('ADDRESS')['CATEGORY'])
+    head100['Top_Category'] = top_cat
+head100['Closure_Rate'] = (head100['Closed_Cases'] / head100['Total_Cases'] * 100).round(1)
+head100['Open_Cases'] = head100['Total_Cases'] - head100['Closed_Cases']
 
 # Top 25 addresses
-top_25 = address_counts.head(25)
+top_25 = head100.head(25)
 print(f"\n📍 TOP 25 ADDRESSES BY COMPLAINT VOLUME")
 print(f"{'Rank':<6} {'Address':<55} {'Cases':>8} {'Open':>8} {'Top Issue':<30}")
 print("-" * 110)
-for rank, (address, row) in enumerate(top_25.iterrows(), 1):
+for rank, row in enumerate(top_25.itertuples(), 1):
+    address = row.Index
     addr_display = address[:52] + "..." if len(address) > 55 else address
-    cat_display = row['Top_Category'][:27] + "..." if len(str(row['Top_Category'])) > 30 else row['Top_Category']
-    print(f"{rank:<6} {addr_display:<55} {int(row['Total_Cases']):>8} {int(row['Open_Cases']):>8} {cat_display:<30}")
+    cat_display = row.Top_Category[:27] + "..." if len(str(row.Top_Category)) > 30 else row.Top_Category
+    print(f"{rank:<6} {addr_display:<55} {int(row.Total_Cases):>8} {int(row.Open_Cases):>8} {cat_display:<30}")
 
 print("\n[3/5] Analyzing Repeat Offenders...")
 print("-" * 80)
 
-# Addresses with 10+ complaints
-repeat_offenders = address_counts[address_counts['Total_Cases'] >= 10]
+# All three thresholds (10+/20+/50+) in one vectorized pass over the counts
+tc = address_counts['Total_Cases'].to_numpy()
+thresholds = np.array([10, 20, 50])
+masks = tc[:, None] >= thresholds[None, :]
+n_addresses_over = masks.sum(axis=0)
+cases_over = (tc[:, None] * masks).sum(axis=0)
+
+n_repeat, n_high, n_chronic = n_addresses_over
+cases_repeat, cases_high, cases_chronic = cases_over
+
 print(f"\n🔴 REPEAT OFFENDERS (10+ complaints)")
-print(f"   Total addresses with 10+ complaints: {len(repeat_offenders):,}")
-print(f"   Total cases from these addresses: {repeat_offenders['Total_Cases'].sum():,}")
-print(f"   Percentage of all cases: {repeat_offenders['Total_Cases'].sum()/len(df_with_address)*100:.1f}%")
+print(f"   Total addresses with 10+ complaints: {n_repeat:,}")
+print(f"   Total cases from these addresses: {cases_repeat:,}")
+print(f"   Percentage of all cases: {cases_repeat/len(df_with_address)*100:.1f}%")
 
-# Addresses with 20+ complaints
-high_volume = address_counts[address_counts['Total_Cases'] >= 20]
 print(f"\n⚠️  HIGH VOLUME (20+ complaints)")
-print(f"   Total addresses: {len(high_volume):,}")
-print(f"   Total cases: {high_volume['Total_Cases'].sum():,}")
+print(f"   Total addresses: {n_high:,}")
+print(f"   Total cases: {cases_high:,}")
 
-# Addresses with 50+ complaints
-chronic = address_counts[address_counts['Total_Cases'] >= 50]
 print(f"\n🚨 CHRONIC LOCATIONS (50+ complaints)")
-print(f"   Total addresses: {len(chronic):,}")
-print(f"   Total cases: {chronic['Total_Cases'].sum():,}")
+print(f"   Total addresses: {n_chronic:,}")
+print(f"   Total cases: {cases_chronic:,}")
 
 # Analyze categories for top addresses
 print("\n[4/5] Category Breakdown for Top Addresses...")
 print("-" * 80)
 
-top_10_addresses = address_counts.head(10).index
+top_10_addresses = head100.head(10).index
+
+# One grouped count over just the top addresses instead of re-scanning the
+# full frame with a fresh boolean mask per address
+top_addr_cats = (df_with_address[df_with_address['ADDRESS'].isin(top_10_addresses)]
+                 .groupby(['ADDRESS', 'CATEGORY'], sort=False, observed=True).size()
+                 .sort_values(ascending=False))
 
 for address in top_10_addresses[:5]:
-    addr_data = df_with_address[df_with_address['ADDRESS'] == address]
-    top_cats = addr_data['CATEGORY'].value_counts().head(3)
+    top_cats = top_addr_cats.loc[address].head(3)
     addr_display = address[:60] if len(address) <= 60 else address[:57] + "..."
-    print(f"\n📍 {addr_display} ({len(addr_data)} cases)")
+    print(f"\n📍 {addr_display} ({int(address_counts.loc[address, 'Total_Cases'])} cases)")
     for cat, count in top_cats.items():
         cat_display = cat[:50] if len(cat) <= 50 else cat[:47] + "..."
         print(f"   - {cat_display}: {count}")
 
 print("\n[5/5] Creating Visualizations...")
 
+
 # ============================================================================
 # VISUALIZATION 1: Top 20 Addresses by Complaint Volume
 # ============================================================================
-fig, ax = plt.subplots(figsize=(14, 10))
+def plot_top_addresses(top_20):
+    fig, ax = plt.subplots(figsize=(14, 10))
+
+    addresses = [addr[:40] + "..." if len(addr) > 40 else addr for addr in top_20.index]
+    values = top_20['Total_Cases'].values
 
-top_20 = address_counts.head(20)
-addresses = [addr[:40] + "..." if len(addr) > 40 else addr for addr in top_20.index]
-values = top_20['Total_Cases'].values
+    colors = plt.cm.Reds(np.linspace(0.3, 0.9, len(addresses)))
+    bars = ax.barh(range(len(addresses)), values, color=colors, alpha=0.8, edgecolor='black')
 
-colors = plt.cm.Reds(np.linspace(0.3, 0.9, len(addresses)))
-bars = ax.barh(range(len(addresses)), values, color=colors, alpha=0.8, edgecolor='black')
+    ax.set_yticks(range(len(addresses)))
+    ax.set_yticklabels(addresses, fontsize=9)
+    ax.set_xlabel('Number of Cases', fontsize=12, fontweight='bold')
+    ax.set_title('Top 20 Addresses by Complaint Volume', fontsize=14, fontweight='bold', pad=20)
+    ax.grid(True, alpha=0.3, axis='x')
 
-ax.set_yticks(range(len(addresses)))
-ax.set_yticklabels(addresses, fontsize=9)
-ax.set_xlabel('Number of Cases', fontsize=12, fontweight='bold')
-ax.set_title('Top 20 Addresses by Complaint Volume', fontsize=14, fontweight='bold', pad=20)
-ax.grid(True, alpha=0.3, axis='x')
+    ax.bar_label(bars, labels=[f'{v:,}' for v in values], padding=3, fontweight='bold', fontsize=9)
 
-for i, (bar, val) in enumerate(zip(bars, values)):
-    ax.text(val + max(values)*0.01, i, f'{val:,}', va='center', fontweight='bold', fontsize=9)
+    plt.tight_layout()
+    plt.savefig('output/phase3_address/1_top_addresses_volume.png', dpi=DPI, bbox_inches='tight')
+    plt.close()
+    return '1_top_addresses_volume.png'
 
-plt.tight_layout()
-plt.savefig('output/phase3_address/1_top_addresses_volume.png', dpi=300, bbox_inches='tight')
-print("   ✓ Saved: 1_top_addresses_volume.png")
-plt.close()
 
 # ============================================================================
 # VISUALIZATION 2: Distribution of Complaints per Address
 # ============================================================================
-fig, ax = plt.subplots(figsize=(12, 6))
+def plot_complaint_distribution(total_cases):
+    fig, ax = plt.subplots(figsize=(12, 6))
+
+    bins = [1, 2, 3, 5, 10, 20, 50, 100]
+    hist_data = np.histogram(total_cases, bins=bins)
 
-bins = [1, 2, 3, 5, 10, 20, 50, 100]
-hist_data = np.histogram(address_counts['Total_Cases'], bins=bins)
+    labels = ['1', '2', '3-4', '5-9', '10-19', '20-49', '50+']
+    bars = ax.bar(labels, hist_data[0], color='steelblue', alpha=0.7, edgecolor='black')
+    ax.set_xlabel('Number of Complaints per Address', fontsize=12, fontweight='bold')
+    ax.set_ylabel('Number of Addresses', fontsize=12, fontweight='bold')
+    ax.set_title('Distribution of Complaints per Address', fontsize=14, fontweight='bold', pad=20)
+    ax.grid(True, alpha=0.3, axis='y')
 
-labels = ['1', '2', '3-4', '5-9', '10-19', '20-49', '50+']
-ax.bar(labels, hist_data[0], color='steelblue', alpha=0.7, edgecolor='black')
-ax.set_xlabel('Number of Complaints per Address', fontsize=12, fontweight='bold')
-ax.set_ylabel('Number of Addresses', fontsize=12, fontweight='bold')
-ax.set_title('Distribution of Complaints per Address', fontsize=14, fontweight='bold', pad=20)
-ax.grid(True, alpha=0.3, axis='y')
+    ax.bar_label(bars, labels=[f'{v:,}' for v in hist_data[0]], padding=3, fontweight='bold', fontsize=10)
 
-for i, val in enumerate(hist_data[0]):
-    ax.text(i, val + max(hist_data[0])*0.01, f'{val:,}', ha='center', fontweight='bold', fontsize=10)
+    plt.tight_layout()
+    plt.savefig('output/phase3_address/2_complaint_distribution.png', dpi=DPI, bbox_inches='tight')
+    plt.close()
+    return '2_complaint_distribution.png'
 
-plt.tight_layout()
-plt.savefig('output/phase3_address/2_complaint_distribution.png', dpi=300, bbox_inches='tight')
-print("   ✓ Saved: 2_complaint_distribution.png")
-plt.close()
 
 # ============================================================================
 # VISUALIZATION 3: Closure Rate by Complaint Volume
 # ============================================================================
-fig, ax = plt.subplots(figsize=(12, 6))
-
-# Group addresses by complaint volume
-volume_bins = pd.cut(address_counts['Total_Cases'], bins=[0, 1, 2, 5, 10, 20, 50, 1000], 
-                     labels=['1', '2', '3-5', '6-10', '11-20', '21-50', '50+'])
-closure_by_volume = address_counts.groupby(volume_bins).agg({
-    'Total_Cases': 'sum',
-    'Closed_Cases': 'sum'
-})
-closure_by_volume['Closure_Rate'] = (closure_by_volume['Closed_Cases'] / closure_by_volume['Total_Cases'] * 100)
-
-bars = ax.bar(closure_by_volume.index.astype(str), closure_by_volume['Closure_Rate'], 
-              color='teal', alpha=0.7, edgecolor='black')
-ax.axhline(41.9, color='red', linestyle='--', linewidth=2, label='Overall Average (41.9%)')
-ax.set_xlabel('Complaints per Address', fontsize=12, fontweight='bold')
-ax.set_ylabel('Closure Rate (%)', fontsize=12, fontweight='bold')
-ax.set_title('Closure Rate by Address Complaint Volume', fontsize=14, fontweight='bold', pad=20)
-ax.legend()
-ax.grid(True, alpha=0.3, axis='y')
-
-for bar in bars:
-    height = bar.get_height()
-    ax.text(bar.get_x() + bar.get_width()/2., height + 1, f'{height:.1f}%', ha='center', fontweight='bold')
-
-plt.tight_layout()
-plt.savefig('output/phase3_address/3_closure_rate_by_volume.png', dpi=300, bbox_inches='tight')
-print("   ✓ Saved: 3_closure_rate_by_volume.png")
-plt.close()
+def plot_closure_rate_by_volume(volume_labels, closure_rate_by_bin):
+    fig, ax = plt.subplots(figsize=(12, 6))
+
+    bars = ax.bar(volume_labels, closure_rate_by_bin,
+                  color='teal', alpha=0.7, edgecolor='black')
+    ax.axhline(41.9, color='red', linestyle='--', linewidth=2, label='Overall Average (41.9%)')
+    ax.set_xlabel('Complaints per Address', fontsize=12, fontweight='bold')
+    ax.set_ylabel('Closure Rate (%)', fontsize=12, fontweight='bold')
+    ax.set_title('Closure Rate by Address Complaint Volume', fontsize=14, fontweight='bold', pad=20)
+    ax.legend()
+    ax.grid(True, alpha=0.3, axis='y')
+
+    ax.bar_label(bars, labels=[f'{v:.1f}%' for v in closure_rate_by_bin], padding=3, fontweight='bold')
+
+    plt.tight_layout()
+    plt.savefig('output/phase3_address/3_closure_rate_by_volume.png', dpi=DPI, bbox_inches='tight')
+    plt.close()
+    return '3_closure_rate_by_volume.png'
+
+
+# Group addresses by complaint volume - 7 fixed integer bins, so a
+# searchsorted + bincount pass beats pd.cut plus a hashed groupby
+volume_labels = ['1', '2', '3-5', '6-10', '11-20', '21-50', '50+']
+cc = address_counts['Closed_Cases'].to_numpy()
+bin_idx = np.searchsorted([1, 2, 5, 10, 20, 50], tc, side='left')
+total_by_bin = np.bincount(bin_idx, weights=tc, minlength=7)
+closed_by_bin = np.bincount(bin_idx, weights=cc, minlength=7)
+closure_rate_by_bin = np.where(total_by_bin > 0, closed_by_bin / np.maximum(total_by_bin, 1) * 100, 0)
+
+# Every figure consumes only its small pre-aggregated inputs, so rasterize
+# them in parallel worker processes instead of one after another
+viz_tasks = [
+    (plot_top_addresses, (head100.head(20),)),
+    (plot_complaint_distribution, (address_counts['Total_Cases'].to_numpy(),)),
+    (plot_closure_rate_by_volume, (volume_labels, closure_rate_by_bin)),
+]
+# Explicit fork context: this script runs at module scope with no __main__
+# guard, so spawn/forkserver workers would re-import and re-run the whole
+# analysis recursively
+with ProcessPoolExecutor(max_workers=min(4, len(viz_tasks)),
+                         mp_context=multiprocessing.get_context('fork')) as executor:
+    futures = [executor.submit(fn, *args) for fn, args in viz_tasks]
+    for future in futures:
+        print(f"   ✓ Saved: {future.result()}")
 
 # Save top addresses to CSV
-address_counts.head(100).to_csv('output/phase3_address/top_100_addresses.csv')
+head100.to_csv('output/phase3_address/top_100_addresses.csv')
 print("   ✓ Saved: top_100_addresses.csv")
 
 print("\n" + "=" * 80)
@@ -190,9 +272,9 @@ print("✅ ADDRESS ANALYSIS COMPLETE!")
 print("=" * 80)
 print(f"\n📊 KEY FINDINGS:")
 print(f"   1. Top address: {address_counts.index[0][:60]} ({int(address_counts.iloc[0]['Total_Cases'])} cases)")
-print(f"   2. Addresses with 10+ complaints: {len(repeat_offenders):,}")
-print(f"   3. Addresses with 50+ complaints: {len(chronic):,}")
-print(f"   4. {repeat_offenders['Total_Cases'].sum():,} cases ({repeat_offenders['Total_Cases'].sum()/len(df_with_address)*100:.1f}%) from repeat addresses")
+print(f"   2. Addresses with 10+ complaints: {n_repeat:,}")
+print(f"   3. Addresses with 50+ complaints: {n_chronic:,}")
+print(f"   4. {cases_repeat:,} cases ({cases_repeat/len(df_with_address)*100:.1f}%) from repeat addresses")
 
 print(f"\n📁 All outputs saved to: output/phase3_address/")
 print("=" * 80)
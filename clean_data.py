@@ -7,8 +7,22 @@ and converts date strings into proper datetime objects.
 import pandas as pd
 import numpy as np
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+# Single-char substitutions (dashes, bullets, whitespace controls) fused
+# into one translation table so they apply in one pass; anything else
+# outside printable ASCII is stripped by the regex below
+_TRANSLATION = str.maketrans({
+    '—': '-', '–': '-',   # em-dash, en-dash
+    '•': '-', '\xb7': '-',   # bullet points
+    '\r': ' ', '\n': ' ', '\t': ' ',
+})
+
+# Keep only printable ASCII; collapse runs of spaces
+_NON_PRINTABLE_RE = re.compile(r'[^\x20-\x7E]')
+_MULTI_SPACE_RE = re.compile(r' +')
+
 
 def clean_text(text):
     """
@@ -22,66 +36,13 @@ def clean_text(text):
     """
     if pd.isna(text) or text == '':
         return text
-    
-    # Convert to string
-    text = str(text)
-    
-    # Replace non-ASCII quotes with standard quotes
-    text = text.replace(''', "'")
-    text = text.replace(''', "'")
-    text = text.replace('"', '"')
-    text = text.replace('"', '"')
-    
-    # Replace em-dash and en-dash with regular dash
-    text = text.replace('—', '-')
-    text = text.replace('–', '-')
-    
-    # Replace special bullet points
-    text = text.replace('•', '-')
-    text = text.replace('·', '-')
-    
-    # Remove emojis and other problematic Unicode characters
-    # Keep only printable ASCII and common punctuation
-    text = re.sub(r'[^\x20-\x7E\n\r\t]', '', text)
-    
-    # Normalize whitespace - replace multiple spaces with single space
-    text = re.sub(r' +', ' ', text)
-    
-    # Replace newlines and carriage returns with spaces to prevent CSV issues
-    text = text.replace('\r\n', ' ')
-    text = text.replace('\n', ' ')
-    text = text.replace('\r', ' ')
-    
-    # Replace tabs with spaces
-    text = text.replace('\t', ' ')
-    
-    # Clean up multiple spaces again after newline replacement
-    text = re.sub(r' +', ' ', text)
-    
-    # Strip leading/trailing whitespace
-    text = text.strip()
-    
-    return text
 
-
-def convert_to_datetime(date_str):
-    """
-    Convert date string to datetime object.
-    
-    Args:
-        date_str: Date string to convert
-        
-    Returns:
-        Datetime object or NaT if conversion fails
-    """
-    if pd.isna(date_str) or date_str == '':
-        return pd.NaT
-    
-    try:
-        return pd.to_datetime(date_str)
-    except Exception as e:
-        print(f"Warning: Could not parse date '{date_str}': {e}")
-        return pd.NaT
+    # Same three passes the column pipeline in clean_csv_file runs: one
+    # translate for the fixed substitutions, one regex to drop anything
+    # non-printable, one to collapse the spaces left behind
+    text = str(text).translate(_TRANSLATION)
+    text = _NON_PRINTABLE_RE.sub('', text)
+    return _MULTI_SPACE_RE.sub(' ', text).strip()
 
 
 def clean_csv_file(input_filepath, output_filepath):
@@ -95,38 +56,62 @@ def clean_csv_file(input_filepath, output_filepath):
     print(f"\n{'='*80}")
     print(f"CLEANING: {input_filepath}")
     print(f"{'='*80}\n")
-    
-    # Load the data
+
+    # Skip the whole clean/parse/write cycle when the input hasn't changed
+    # since the last run - a sidecar records the input's mtime+size
+    output_filepath = Path(output_filepath)
+    parquet_filepath = output_filepath.with_suffix('.parquet')
+    key_path = output_filepath.with_suffix('.key')
+    stat = Path(input_filepath).stat()
+    key = f"{stat.st_mtime_ns}:{stat.st_size}"
+    if (key_path.exists() and key_path.read_text() == key
+            and output_filepath.exists() and parquet_filepath.exists()):
+        print(f"✓ Input unchanged, keeping existing {output_filepath}")
+        return
+
+    # Load the data - dates parse inside the CSV reader so tokenization and
+    # datetime conversion happen in a single pass over the bytes
     print("Loading data...")
-    df = pd.read_csv(input_filepath, dtype=str)
-    
+    df = pd.read_csv(
+        input_filepath,
+        dtype={'OBJECTDESC': str, 'TITLE': str, 'CASECLOSUREREASONDESCRIPTION': str},
+        parse_dates=['CREATIONDATE', 'CLOSEDDATETIME'],
+        date_format='ISO8601',
+    )
+
     print(f"Loaded {len(df):,} rows")
     
     # Text columns to clean
     text_columns = ['OBJECTDESC', 'TITLE', 'CASECLOSUREREASONDESCRIPTION']
     
-    # Clean text columns
+    # Clean text columns - whole-column str ops instead of a per-cell apply:
+    # one translate pass for the fixed substitutions, one regex pass to strip
+    # non-printable characters, one to collapse whitespace
     print("\nCleaning text columns...")
     for col in text_columns:
         if col in df.columns:
             print(f"  - Cleaning {col}...")
-            df[col] = df[col].apply(clean_text)
+            df[col] = (df[col].str.translate(_TRANSLATION)
+                       .str.replace(_NON_PRINTABLE_RE, '', regex=True)
+                       .str.replace(_MULTI_SPACE_RE, ' ', regex=True)
+                       .str.strip())
     
-    # Date columns to convert
+    # Date columns (already parsed at read time)
     date_columns = ['CREATIONDATE', 'CLOSEDDATETIME']
-    
-    # Convert date columns
-    print("\nConverting date columns to datetime...")
-    for col in date_columns:
-        if col in df.columns:
-            print(f"  - Converting {col}...")
-            df[col] = df[col].apply(convert_to_datetime)
-    
+
     # Save cleaned data
     print(f"\nSaving cleaned data to {output_filepath}...")
     df.to_csv(output_filepath, index=False)
-    
+
+    # Also write a typed Parquet copy - columnar, no date re-parsing, and an
+    # order of magnitude faster for the analysis scripts to load
+    df.to_parquet(parquet_filepath, engine='pyarrow', compression='snappy')
+
+    # Record the input fingerprint so re-runs on the same input short-circuit
+    key_path.write_text(key)
+
     print(f"✓ Successfully saved {len(df):,} rows to {output_filepath}")
+    print(f"✓ Parquet copy saved to {parquet_filepath}")
     
     # Show summary statistics
     print("\n" + "="*80)
@@ -159,17 +144,19 @@ def main():
     output_dir = Path('cleaned_data')
     output_dir.mkdir(exist_ok=True)
     
-    # Clean current data
-    clean_csv_file(
-        'original_data/callcenterdatacurrent.csv',
-        output_dir / 'callcenterdatacurrent_cleaned.csv'
-    )
-    
-    # Clean historical data
-    clean_csv_file(
-        'original_data/callcenterdatahistorical.csv',
-        output_dir / 'callcenterdatahistorical_cleaned.csv'
-    )
+    # The two files are independent and each is CPU-bound on regex + CSV
+    # writing, so clean them in parallel worker processes (their progress
+    # output may interleave)
+    jobs = [
+        ('original_data/callcenterdatacurrent.csv',
+         output_dir / 'callcenterdatacurrent_cleaned.csv'),
+        ('original_data/callcenterdatahistorical.csv',
+         output_dir / 'callcenterdatahistorical_cleaned.csv'),
+    ]
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(clean_csv_file, src, dst) for src, dst in jobs]
+        for future in futures:
+            future.result()
     
     print("\n" + "="*80)
     print("CLEANING COMPLETE")